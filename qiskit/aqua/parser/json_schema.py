@@ -36,6 +36,7 @@ from qiskit.aqua.utils.backend_utils import (is_statevector_backend,
                                              is_local_backend,
                                              is_aer_provider,
                                              is_aer_statevector_backend)
+from qiskit.aqua.utils.run_circuits import MAX_POLLING_INTERVAL
 
 logger = logging.getLogger(__name__)
 
@@ -533,6 +534,11 @@ class JSONSchema:
                 'default': 5.0,
                 'minimum': 0.0,
             }
+            self._schema['properties'][JSONSchema.BACKEND]['properties']['max_wait'] = {
+                'type': 'number',
+                'default': MAX_POLLING_INTERVAL,
+                'minimum': 0.0,
+            }
 
     def update_pluggable_schemas(self, input_parser):
         """
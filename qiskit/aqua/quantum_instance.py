@@ -32,6 +32,7 @@ from .utils.backend_utils import (is_ibmq_provider,
                                   is_aer_qasm,
                                   support_backend_options)
 from .utils.circuit_utils import summarize_circuits
+from .utils.run_circuits import MAX_POLLING_INTERVAL
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ class QuantumInstance:
     BACKEND_CONFIG = ['basis_gates', 'coupling_map']
     COMPILE_CONFIG = ['pass_manager', 'initial_layout', 'seed_transpiler', 'optimization_level']
     RUN_CONFIG = ['shots', 'max_credits', 'memory', 'seed_simulator']
-    QJOB_CONFIG = ['timeout', 'wait']
+    QJOB_CONFIG = ['timeout', 'wait', 'max_wait']
     NOISE_CONFIG = ['noise_model']
 
     # https://github.com/Qiskit/qiskit-aer/blob/master/qiskit/providers/aer/backends/qasm_simulator.py
@@ -68,7 +69,7 @@ class QuantumInstance:
                  skip_qobj_validation=True,
                  measurement_error_mitigation_cls=None, cals_matrix_refresh_period=30,
                  measurement_error_mitigation_shots=None,
-                 job_callback=None):
+                 job_callback=None, max_wait=MAX_POLLING_INTERVAL):
         """Constructor.
 
         Args:
@@ -112,7 +113,13 @@ class QuantumInstance:
             job_callback (Callable, optional): callback used in querying info of
                                                the submitted job, and
                                                providing the following arguments: job_id,
-                                               job_status, queue_position, job
+                                               job_status, queue_position, job.
+                                               It is called when the status or the queue
+                                               position changes and once the job is final.
+                                               When the circuits are split into several jobs,
+                                               it is called concurrently from one thread per job
+            max_wait (float, optional): maximum seconds between queries while the job is
+                                        queued, the interval grows from `wait` up to it
 
         Raises:
             AquaError: the shots exceeds the maximum number of shots
@@ -156,7 +163,7 @@ class QuantumInstance:
 
         # setup job config
         self._qjob_config = {'timeout': timeout} if self.is_local \
-            else {'timeout': timeout, 'wait': wait}
+            else {'timeout': timeout, 'wait': wait, 'max_wait': max_wait}
 
         # setup noise config
         self._noise_config = {}
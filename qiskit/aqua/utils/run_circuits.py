@@ -16,12 +16,14 @@
 
 import sys
 import logging
-import time
+import atexit
+import threading
 import copy
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures
+from weakref import WeakKeyDictionary
 
-import numpy as np
 from qiskit.providers import BaseBackend, JobStatus, JobError
 from qiskit.providers.jobstatus import JOB_FINAL_STATES
 from qiskit.providers.basicaer import BasicAerJob
@@ -33,9 +35,30 @@ from qiskit.aqua.utils.backend_utils import (is_aer_provider,
                                              is_local_backend)
 
 MAX_CIRCUITS_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_CIRCUITS_PER_JOB', None)
+MIN_POLLING_INTERVAL = 0.1
+MAX_POLLING_INTERVAL = 30.0
+MAX_SUBMIT_WORKERS = os.environ.get('QISKIT_AQUA_MAX_SUBMIT_WORKERS', None)
 
 logger = logging.getLogger(__name__)
 
+# per backend capabilities, the backend does not change between the many runs of an algorithm
+_BACKEND_CAPABILITIES = WeakKeyDictionary()
+
+# thread pool shared by all the runs to submit jobs, the jobs are watched on a pool of each run
+_SUBMIT_POOL = None
+_SUBMIT_POOL_LOCK = threading.Lock()
+
+
+def _get_submit_pool():
+    """Return the shared thread pool used to submit jobs, creating it on first use."""
+    global _SUBMIT_POOL  # pylint: disable=global-statement
+    with _SUBMIT_POOL_LOCK:
+        if _SUBMIT_POOL is None:
+            max_workers = int(MAX_SUBMIT_WORKERS) if MAX_SUBMIT_WORKERS is not None else 16
+            _SUBMIT_POOL = ThreadPoolExecutor(max_workers=max_workers)
+            atexit.register(_SUBMIT_POOL.shutdown)
+    return _SUBMIT_POOL
+
 
 def find_regs_by_name(circuit, name, qreg=True):
     """Find the registers in the circuits.
@@ -58,21 +81,56 @@ def find_regs_by_name(circuit, name, qreg=True):
     return found_reg
 
 
-def _combine_result_objects(results):
-    """Temporary helper function.
+class _ResultCombiner:
+    """Temporary helper class, combining the results of the split qobjs as the jobs complete.
+
+    The number of experiments of each qobj is known up front, so the experiment results
+    are written straight into their slots of a pre-sized list, in whichever order the jobs
+    complete. They are only read, so they are shared rather than copied.
 
     TODO:
-        This function would be removed after Terra supports job with infinite circuits.
+        This class would be removed after Terra supports job with infinite circuits.
     """
-    if len(results) == 1:
-        return results[0]
-
-    new_result = copy.deepcopy(results[0])
 
-    for idx in range(1, len(results)):
-        new_result.results.extend(results[idx].results)
-
-    return new_result
+    def __init__(self, qobjs):
+        self._offsets = []
+        self._sizes = []
+        offset = 0
+        for qobj in qobjs:
+            self._offsets.append(offset)
+            self._sizes.append(len(qobj.experiments))
+            offset += len(qobj.experiments)
+        self._exp_results = [None] * offset
+        self._added = set()
+        self._result = None
+
+    def add(self, idx, result):
+        """Add the result of the `idx`-th qobj.
+
+        Raises:
+            AquaError: the result does not hold one result per experiment of the qobj
+        """
+        if len(result.results) != self._sizes[idx]:
+            raise AquaError("The result of the {}-th qobj has {} experiment results "
+                            "but the qobj has {} experiments.".format(idx, len(result.results),
+                                                                      self._sizes[idx]))
+        offset = self._offsets[idx]
+        self._exp_results[offset:offset + self._sizes[idx]] = result.results
+        self._added.add(idx)
+        if idx == 0:
+            self._result = copy.copy(result)
+
+    def result(self):
+        """Return the combined result.
+
+        Raises:
+            AquaError: the result of some qobj was not added
+        """
+        if len(self._added) != len(self._offsets):
+            raise AquaError("Missing the results of the qobjs {}.".format(
+                sorted(set(range(len(self._offsets))) - self._added)))
+        self._result.results = self._exp_results
+        return self._result
 
 
 # pylint: disable=invalid-name
@@ -86,46 +144,49 @@ def maybe_add_aer_expectation_instruction(qobj, options):
         QasmQobj: a mutated qobj with aer expectation instruction inserted
     """
     if 'expectation' in options:
-        from qiskit.providers.aer.utils.qobj_utils \
-            import snapshot_instr, append_instr, get_instr_pos
+        from qiskit.providers.aer.utils.qobj_utils import snapshot_instr
         # add others, how to derive the correct used number of qubits?
         # the compiled qobj could be wrong if coupling map is used.
         params = options['expectation']['params']
         num_qubits = options['expectation']['num_qubits']
+        qubits = list(range(num_qubits))
+        single_param = len(params) == 1
 
-        for idx in range(len(qobj.experiments)):
+        for idx, experiment in enumerate(qobj.experiments):
             # if multiple params are provided, we assume
             # that each circuit is corresponding one param
             # otherwise, params are used for all circuits.
-            param_idx = idx if len(params) > 1 else 0
-            snapshot_pos = get_instr_pos(qobj, idx, 'snapshot')
-            if not snapshot_pos:  # does not append the instruction yet.
-                new_ins = snapshot_instr('expectation_value_pauli', 'test',
-                                         list(range(num_qubits)), params=params[param_idx])
-                qobj = append_instr(qobj, idx, new_ins)
-            else:
-                for i in snapshot_pos:  # update all expectation_value_snapshot
-                    if qobj.experiments[idx].instructions[i].type == 'expectation_value_pauli':
-                        qobj.experiments[idx].instructions[i].params = params[param_idx]
+            param = params[0] if single_param else params[idx]
+            instructions = experiment.instructions
+            has_snapshot = False
+            for ins in instructions:
+                if ins.name == 'snapshot':
+                    has_snapshot = True
+                    # update all expectation_value_snapshot
+                    if ins.type == 'expectation_value_pauli':
+                        ins.params = param
+            if not has_snapshot:  # does not append the instruction yet.
+                instructions.append(snapshot_instr('expectation_value_pauli', 'test',
+                                                   qubits, params=param))
     return qobj
 
 
 def _split_qobj_to_qobjs(qobj, chunk_size):
+    num_experiments = len(qobj.experiments)
+    if num_experiments <= chunk_size:
+        return [qobj]
+
+    if not isinstance(qobj, QasmQobj):
+        raise AquaError("Only support QasmQobj now.")
+
     qobjs = []
-    num_chunks = int(np.ceil(len(qobj.experiments) / chunk_size))
-    if num_chunks == 1:
-        qobjs = [qobj]
-    else:
-        if isinstance(qobj, QasmQobj):
-            qobj_template = QasmQobj(qobj_id=qobj.qobj_id,
-                                     config=qobj.config, experiments=[], header=qobj.header)
-            for i in range(num_chunks):
-                temp_qobj = copy.deepcopy(qobj_template)
-                temp_qobj.qobj_id = str(uuid.uuid4())
-                temp_qobj.experiments = qobj.experiments[i * chunk_size:(i + 1) * chunk_size]
-                qobjs.append(temp_qobj)
-        else:
-            raise AquaError("Only support QasmQobj now.")
+    num_chunks = (num_experiments + chunk_size - 1) // chunk_size
+    # the chunks only differ in id and experiments, so they share one copy of the config
+    config = copy.copy(qobj.config)
+    for i in range(num_chunks):
+        qobjs.append(QasmQobj(qobj_id=str(uuid.uuid4()), config=config,
+                              experiments=qobj.experiments[i * chunk_size:(i + 1) * chunk_size],
+                              header=qobj.header))
 
     return qobjs
 
@@ -149,8 +210,23 @@ def _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_va
     return job, job_id
 
 
-def _safe_get_job_status(job, job_id):
+def _poll_interval(job_status, attempt, wait, max_wait):
+    """Seconds to sleep before querying the job again.
+
+    Queued jobs are polled less and less often, the interval doubling from `wait` up
+    to `max_wait`; jobs in any other state are polled every `wait` seconds.
+    """
+    wait = max(wait, MIN_POLLING_INTERVAL)
+    if job_status == JobStatus.QUEUED:
+        # the cap is reached long before the exponent limit, which keeps the product finite
+        return min(wait * 2 ** min(attempt, 16), max(max_wait, wait))
+    return wait
+
+
+def _safe_get_job_status(job, job_id, wait=5, max_wait=MAX_POLLING_INTERVAL, stop_event=None):
 
+    stop_event = stop_event or threading.Event()
+    attempt = 0
     while True:
         try:
             job_status = job.status()
@@ -159,7 +235,10 @@ def _safe_get_job_status(job, job_id):
             logger.warning("FAILURE: job id: %s, "
                            "status: 'FAIL_TO_GET_STATUS' "
                            "Terra job error: %s", job_id, ex)
-            time.sleep(5)
+            # back off on consecutive failures, in the same way as for a queued job
+            if stop_event.wait(_poll_interval(JobStatus.QUEUED, attempt, wait, max_wait)):
+                raise AquaError("Stopped watching job id: {}.".format(job_id))
+            attempt += 1
         except Exception as ex:  # pylint: disable=broad-except
             raise AquaError("FAILURE: job id: {}, "
                             "status: 'FAIL_TO_GET_STATUS' "
@@ -167,6 +246,182 @@ def _safe_get_job_status(job, job_id):
     return job_status
 
 
+def _watch_job(job, job_id, idx, qobj, backend, qjob_config, result_config,
+               backend_options, noise_config, skip_qobj_validation, job_callback,
+               stop_event=None):
+    """Poll a submitted job until its result is available, submitting it again on failure.
+
+    Returns:
+        Result: the successful result of the job
+
+    Raises:
+        AquaError: `stop_event` is set before the result is available
+    """
+    wait = qjob_config.get('wait', 5)
+    max_wait = qjob_config.get('max_wait', MAX_POLLING_INTERVAL)
+    # results of the experiments completed by failed jobs, and the positions in the original
+    # qobj of the experiments in the qobj currently submitted
+    exp_results = [None] * len(qobj.experiments)
+    pending = list(range(len(qobj.experiments)))
+    stop_event = stop_event or threading.Event()
+    while True:
+        logger.info("Running %s-th qobj, job id: %s", idx, job_id)
+        # try to get result if possible
+        prev_status = None
+        prev_queue_position = None
+        attempt = 0
+        while True:
+            job_status = _safe_get_job_status(job, job_id, wait, max_wait, stop_event)
+            if job_status != prev_status:
+                # poll often again whenever the job changes state
+                attempt = 0
+            queue_position = 0
+            if job_status in JOB_FINAL_STATES:
+                # do callback again after the job is in the final states
+                if job_callback is not None:
+                    job_callback(job_id, job_status, queue_position, job)
+                break
+            if job_status == JobStatus.QUEUED:
+                queue_position = job.queue_position()
+                logger.info("Job id: %s is queued at position %s", job_id, queue_position)
+            else:
+                logger.info("Job id: %s, status: %s", job_id, job_status)
+            # only notify the callback when the status or the queue position changes
+            if job_callback is not None and \
+                    (job_status, queue_position) != (prev_status, prev_queue_position):
+                job_callback(job_id, job_status, queue_position, job)
+            prev_status = job_status
+            prev_queue_position = queue_position
+            if stop_event.wait(_poll_interval(job_status, attempt, wait, max_wait)):
+                raise AquaError("Stopped watching job id: {}.".format(job_id))
+            attempt += 1
+
+        # get result after the status is DONE
+        if job_status == JobStatus.DONE:
+            while True:
+                result = job.result(**result_config)
+                if result.success:
+                    logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
+                    if len(pending) < len(exp_results):
+                        for pos, exp_result in zip(pending, result.results):
+                            exp_results[pos] = exp_result
+                        result.results = exp_results
+                    return result
+
+                logger.warning("FAILURE: Job id: %s", job_id)
+                logger.warning("Job (%s) is completed anyway, retrieve result "
+                               "from backend again.", job_id)
+                job = backend.retrieve_job(job_id)
+
+        # for other cases, resubmit the qobj until the result is available.
+        # since if there is no result returned, there is no way algorithm can do any process
+        # the submitted qobj is still at hand, so there is no need to get it back from the job
+        if job_status == JobStatus.CANCELLED:
+            logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
+                           job_id)
+        elif job_status == JobStatus.ERROR:
+            logger.warning("FAILURE: Job id: %s encounters the error. "
+                           "Error is : %s. Re-submit the Qobj.",
+                           job_id, job.error_message())
+            qobj, pending = _keep_completed_experiments(job, job_id, qobj, pending,
+                                                        exp_results, result_config)
+        else:
+            logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
+                            "Re-submit the Qobj.", job_id, job_status)
+
+        if stop_event.is_set():
+            raise AquaError("Stopped watching job id: {}, it is not re-submitted.".format(job_id))
+        job, job_id = _safe_submit_qobj(qobj, backend,
+                                        backend_options,
+                                        noise_config, skip_qobj_validation)
+
+
+def _keep_completed_experiments(job, job_id, qobj, pending, exp_results, result_config):
+    """Keep the experiments completed by a failed job and return the ones to resubmit.
+
+    Args:
+        job (BaseJob): the failed job
+        job_id (str): id of the failed job
+        qobj (QasmQobj): the qobj submitted by the job
+        pending (list[int]): positions in the original qobj of the experiments of `qobj`
+        exp_results (list): results of the original qobj, completed experiments are stored
+        result_config (dict): arguments to retrieve the result of the job
+
+    Returns:
+        tuple: the qobj to resubmit and the positions of its experiments in the original qobj
+    """
+    try:
+        partial_result = job.result(partial=True, **result_config)
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.info("Can not get the partial result of job id: %s. Error: %s", job_id, ex)
+        return qobj, pending
+
+    if partial_result is None or len(partial_result.results) != len(qobj.experiments):
+        return qobj, pending
+
+    failed = [i for i, exp_result in enumerate(partial_result.results) if not exp_result.success]
+    if not failed or len(failed) == len(qobj.experiments):
+        return qobj, pending
+
+    for i, exp_result in enumerate(partial_result.results):
+        if exp_result.success:
+            exp_results[pending[i]] = exp_result
+    logger.info("Job id: %s completed %s of %s experiments, only the failed ones are "
+                "re-submitted.", job_id, len(qobj.experiments) - len(failed),
+                len(qobj.experiments))
+    failed_qobj = QasmQobj(qobj_id=str(uuid.uuid4()), config=qobj.config,
+                           experiments=[qobj.experiments[i] for i in failed],
+                           header=qobj.header)
+    return failed_qobj, [pending[i] for i in failed]
+
+
+def _cancel_jobs(submitted):
+    """Cancel the submitted (job, job id) pairs which will not be watched.
+
+    The jobs which can not be cancelled are logged.
+    """
+    for job, job_id in submitted:
+        try:
+            job.cancel()
+            logger.warning("Job id: %s is cancelled since the run failed.", job_id)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("FAILURE: Job id: %s can not be cancelled, it keeps running "
+                           "although the run failed. Error: %s", job_id, ex)
+
+
+def _get_backend_capabilities(backend):
+    """Return the cached capabilities of the backend used by `run_qobj` and `run_on_backend`.
+
+    Args:
+        backend (BaseBackend): backend instance
+
+    Returns:
+        dict: `is_simulator`, `is_local`, `max_experiments` of the backend and
+              `run_without_validation`, the function submitting a qobj without validation
+    """
+    try:
+        return _BACKEND_CAPABILITIES[backend]
+    except KeyError:
+        pass
+    except TypeError:
+        # a backend which can not be hashed can not be cached either
+        return _backend_capabilities(backend)
+
+    capabilities = _backend_capabilities(backend)
+    _BACKEND_CAPABILITIES[backend] = capabilities
+    return capabilities
+
+
+def _backend_capabilities(backend):
+    is_local = is_local_backend(backend)
+    return {
+        'is_simulator': is_simulator_backend(backend),
+        'is_local': is_local,
+        'max_experiments': None if is_local else backend.configuration().max_experiments,
+        'run_without_validation': _select_run_without_validation(backend)
+    }
+
+
 def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
              noise_config=None, skip_qobj_validation=False, job_callback=None):
     """
@@ -178,7 +433,9 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
     Args:
         qobj (QasmQobj): qobj to execute
         backend (BaseBackend): backend instance
-        qjob_config (dict, optional): configuration for quantum job object
+        qjob_config (dict, optional): configuration for quantum job object; `wait` is the
+                                      polling interval (at least 0.1 seconds) and `max_wait`
+                                      caps the growing interval used while a job is queued
         backend_options (dict, optional): configuration for simulator
         noise_config (dict, optional): configuration for noise model
         skip_qobj_validation (bool, optional): Bypass Qobj validation to decrease submission time,
@@ -186,6 +443,10 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
         job_callback (Callable, optional): callback used in querying info of the submitted job, and
                                            providing the following arguments:
                                             job_id, job_status, queue_position, job
+                                           it is called when the status or the queue position
+                                           changes and once the job is in a final state.
+                                           When the qobj is split into several jobs, it is
+                                           called concurrently from one thread per job
 
     Returns:
         Result: Result object
@@ -201,97 +462,125 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
     if backend is None or not isinstance(backend, BaseBackend):
         raise ValueError('Backend is missing or not an instance of BaseBackend')
 
-    with_autorecover = not is_simulator_backend(backend)
+    capabilities = _get_backend_capabilities(backend)
+    with_autorecover = not capabilities['is_simulator']
+    is_local = capabilities['is_local']
 
     if MAX_CIRCUITS_PER_JOB is not None:
         max_circuits_per_job = int(MAX_CIRCUITS_PER_JOB)
     else:
-        if is_local_backend(backend):
+        if is_local:
             max_circuits_per_job = sys.maxsize
         else:
-            max_circuits_per_job = backend.configuration().max_experiments
+            max_circuits_per_job = capabilities['max_experiments']
+
+    # `max_wait` only drives our own polling, it is not an argument of `job.result`
+    result_config = {k: v for k, v in qjob_config.items() if k != 'max_wait'}
 
     # split qobj if it exceeds the payload of the backend
 
     qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
-    jobs = []
-    job_ids = []
-    for qob in qobjs:
-        job, job_id = _safe_submit_qobj(qob, backend,
-                                        backend_options, noise_config, skip_qobj_validation)
-        job_ids.append(job_id)
-        jobs.append(job)
-
-    results = []
+    if len(qobjs) == 1:
+        # no split, run the single job without the bookkeeping of the split jobs
+        job, job_id = _safe_submit_qobj(qobj, backend, backend_options,
+                                        noise_config, skip_qobj_validation)
+        if not with_autorecover:
+            return job.result(**result_config)
+        logger.info("Backend status: %s", backend.status())
+        logger.info("Job id: %s is submitted.", job_id)
+        return _watch_job(job, job_id, 0, qobj, backend, qjob_config, result_config,
+                          backend_options, noise_config, skip_qobj_validation, job_callback)
+
+    if is_local:
+        submitted = [_safe_submit_qobj(qob, backend, backend_options,
+                                       noise_config, skip_qobj_validation) for qob in qobjs]
+    else:
+        # each submission to a remote backend is a blocking request, so send them concurrently
+        pool = _get_submit_pool()
+        futures = [pool.submit(_safe_submit_qobj, qob, backend, backend_options,
+                               noise_config, skip_qobj_validation) for qob in qobjs]
+        try:
+            submitted = [future.result() for future in futures]
+        except Exception:
+            # do not leave the other jobs running unwatched on the backend
+            for future in futures:
+                future.cancel()
+            wait_futures(futures)
+            _cancel_jobs([future.result() for future in futures
+                          if not future.cancelled() and future.exception() is None])
+            raise
+    jobs = [job for job, _ in submitted]
+    job_ids = [job_id for _, job_id in submitted]
+
+    combiner = _ResultCombiner(qobjs)
+    # the jobs may take hours, so they are watched on a pool of this run, one thread per job,
+    # rather than holding the workers shared with the other runs
+    executor = ThreadPoolExecutor(max_workers=len(jobs))
+    stop_event = threading.Event()
     if with_autorecover:
         logger.info("Backend status: %s", backend.status())
         logger.info("There are %s jobs are submitted.", len(jobs))
         logger.info("All job ids:\n%s", job_ids)
-        for idx, _ in enumerate(jobs):
-            job = jobs[idx]
-            job_id = job_ids[idx]
-            while True:
-                logger.info("Running %s-th qobj, job id: %s", idx, job_id)
-                # try to get result if possible
-                while True:
-                    job_status = _safe_get_job_status(job, job_id)
-                    queue_position = 0
-                    if job_status in JOB_FINAL_STATES:
-                        # do callback again after the job is in the final states
-                        if job_callback is not None:
-                            job_callback(job_id, job_status, queue_position, job)
-                        break
-                    if job_status == JobStatus.QUEUED:
-                        queue_position = job.queue_position()
-                        logger.info("Job id: %s is queued at position %s", job_id, queue_position)
-                    else:
-                        logger.info("Job id: %s, status: %s", job_id, job_status)
-                    if job_callback is not None:
-                        job_callback(job_id, job_status, queue_position, job)
-                    time.sleep(qjob_config['wait'])
-
-                # get result after the status is DONE
-                if job_status == JobStatus.DONE:
-                    while True:
-                        result = job.result(**qjob_config)
-                        if result.success:
-                            results.append(result)
-                            logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
-                            break
-
-                        logger.warning("FAILURE: Job id: %s", job_id)
-                        logger.warning("Job (%s) is completed anyway, retrieve result "
-                                       "from backend again.", job_id)
-                        job = backend.retrieve_job(job_id)
-                    break
-                # for other cases, resubmit the qobj until the result is available.
-                # since if there is no result returned, there is no way algorithm can do any process
-                # get back the qobj first to avoid for job is consumed
-                qobj = job.qobj()
-                if job_status == JobStatus.CANCELLED:
-                    logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
-                                   job_id)
-                elif job_status == JobStatus.ERROR:
-                    logger.warning("FAILURE: Job id: %s encounters the error. "
-                                   "Error is : %s. Re-submit the Qobj.",
-                                   job_id, job.error_message())
-                else:
-                    logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
-                                    "Re-submit the Qobj.", job_id, job_status)
-
-                job, job_id = _safe_submit_qobj(qobj, backend,
-                                                backend_options,
-                                                noise_config, skip_qobj_validation)
-                jobs[idx] = job
-                job_ids[idx] = job_id
+        # poll all jobs concurrently so results are harvested as soon as each one completes
+        futures = {executor.submit(_watch_job, jobs[idx], job_ids[idx], idx, qobjs[idx],
+                                   backend, qjob_config, result_config, backend_options,
+                                   noise_config, skip_qobj_validation, job_callback,
+                                   stop_event): idx
+                   for idx in range(len(jobs))}
     else:
-        results = []
-        for job in jobs:
-            results.append(job.result(**qjob_config))
-
-    result = _combine_result_objects(results) if results else None
-
-    return result
+        # the jobs are already running, wait on them in the order they complete
+        futures = {executor.submit(job.result, **result_config): idx
+                   for idx, job in enumerate(jobs)}
+    try:
+        for future in as_completed(futures):
+            combiner.add(futures[future], future.result())
+    finally:
+        # if a job fails or the run is interrupted, stop watching (and re-submitting)
+        # the other jobs
+        stop_event.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    return combiner.result()
+
+
+def _run_aer_without_validation(backend, qobj, backend_options, noise_config):
+    from qiskit.providers.aer.aerjob import AerJob
+    job_id = str(uuid.uuid4())
+    temp_backend_options = \
+        backend_options['backend_options'] if backend_options != {} else None
+    temp_noise_config = noise_config['noise_model'] if noise_config != {} else None
+    run_job = backend._run_job
+    job = AerJob(backend, job_id, run_job, qobj, temp_backend_options, temp_noise_config, False)
+    # submit with the arguments at hand rather than reading them back from the job
+    job._future = AerJob._executor.submit(run_job, job_id, qobj,
+                                          temp_backend_options, temp_noise_config, False)
+    return job
+
+
+def _run_basicaer_without_validation(backend, qobj, backend_options, noise_config):
+    # pylint: disable=unused-argument
+    job_id = str(uuid.uuid4())
+    backend._set_options(qobj_config=qobj.config, **backend_options)
+    job = BasicAerJob(backend, job_id, backend._run_job, qobj)
+    job._future = job._executor.submit(job._fn, job._job_id, job._qobj)
+    return job
+
+
+def _run_with_validation(backend, qobj, backend_options, noise_config):
+    logger.info(
+        "Can't skip qobj validation for the %s provider.",
+        backend.provider().__class__.__name__)
+    return backend.run(qobj, **backend_options, **noise_config)
+
+
+def _select_run_without_validation(backend):
+    if is_aer_provider(backend):
+        return _run_aer_without_validation
+    if is_basicaer_provider(backend):
+        return _run_basicaer_without_validation
+    return _run_with_validation
 
 
 # skip_qobj_validation = True does what backend.run
@@ -300,25 +589,8 @@ def run_on_backend(backend, qobj, backend_options=None,
                    noise_config=None, skip_qobj_validation=False):
     """ run on backend """
     if skip_qobj_validation:
-        job_id = str(uuid.uuid4())
-        if is_aer_provider(backend):
-            from qiskit.providers.aer.aerjob import AerJob
-            temp_backend_options = \
-                backend_options['backend_options'] if backend_options != {} else None
-            temp_noise_config = noise_config['noise_model'] if noise_config != {} else None
-            job = AerJob(backend, job_id,
-                         backend._run_job, qobj, temp_backend_options, temp_noise_config, False)
-            job._future = job._executor.submit(job._fn, job._job_id, job._qobj, *job._args)
-        elif is_basicaer_provider(backend):
-            backend._set_options(qobj_config=qobj.config, **backend_options)
-            job = BasicAerJob(backend, job_id, backend._run_job, qobj)
-            job._future = job._executor.submit(job._fn, job._job_id, job._qobj)
-        else:
-            logger.info(
-                "Can't skip qobj validation for the %s provider.",
-                backend.provider().__class__.__name__)
-            job = backend.run(qobj, **backend_options, **noise_config)
-        return job
+        run_fn = _get_backend_capabilities(backend)['run_without_validation']
+        return run_fn(backend, qobj, backend_options, noise_config)
     else:
         job = backend.run(qobj, **backend_options, **noise_config)
         return job
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Run Circuits """
+
+import unittest
+import threading
+import time
+from types import SimpleNamespace
+from test.aqua.common import QiskitAquaTestCase
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.compiler import assemble
+from qiskit.providers import BaseBackend, JobStatus
+from qiskit.aqua import AquaError
+from qiskit.aqua.utils.run_circuits import (run_qobj,
+                                            _poll_interval,
+                                            _ResultCombiner,
+                                            _split_qobj_to_qobjs,
+                                            _watch_job,
+                                            MIN_POLLING_INTERVAL)
+
+
+def _result(names, success=True):
+    """ a result with one experiment result per name """
+    return SimpleNamespace(success=success,
+                           results=[SimpleNamespace(success=True, name=name) for name in names])
+
+
+def _names(result):
+    return [exp_result.name for exp_result in result.results]
+
+
+def _qobj(names):
+    """ a qobj with one experiment per name """
+    circuits = []
+    for name in names:
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        circuit = QuantumCircuit(qr, cr, name=name)
+        circuit.measure(qr, cr)
+        circuits.append(circuit)
+    return assemble(circuits)
+
+
+def _exp_names(qobj):
+    return [experiment.header.name for experiment in qobj.experiments]
+
+
+class _MockJob:
+    """ a job which is in its final status at once """
+
+    def __init__(self, job_id, qobj, status, failed=(), partial=True):
+        self._job_id = job_id
+        self._status = status
+        self._names = _exp_names(qobj)
+        self._failed = failed
+        self._partial = partial
+
+    def job_id(self):
+        """ job id """
+        return self._job_id
+
+    def status(self):
+        """ job status """
+        return self._status
+
+    def error_message(self):
+        """ error message """
+        return 'failed experiments {}'.format(self._failed)
+
+    def result(self, partial=False, **kwargs):
+        """ result of the job, with the failed experiments marked as such """
+        # pylint: disable=unused-argument
+        if partial and not self._partial:
+            raise TypeError("result() got an unexpected keyword argument 'partial'")
+        if self._status == JobStatus.ERROR and not partial:
+            raise AssertionError('the complete result of a failed job is not available')
+        results = [SimpleNamespace(success=name not in self._failed, name=name,
+                                   job_id=self._job_id) for name in self._names]
+        return SimpleNamespace(success=not self._failed, results=results)
+
+
+class _MockBackend:
+    """ a backend running the jobs given by `outcomes`, one per submitted qobj """
+
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.submitted = []
+
+    def run(self, qobj, **kwargs):
+        """ run the next job """
+        # pylint: disable=unused-argument
+        self.submitted.append(_exp_names(qobj))
+        job_id = 'job{}'.format(len(self.submitted))
+        status, failed, partial = self._outcomes.pop(0)
+        return _MockJob(job_id, qobj, status, failed, partial)
+
+
+class TestPollInterval(QiskitAquaTestCase):
+    """ Test the polling interval of the job status """
+
+    def test_floor(self):
+        """ interval is at least the minimum polling interval """
+        self.assertEqual(_poll_interval(JobStatus.RUNNING, 0, 0, 30), MIN_POLLING_INTERVAL)
+        self.assertEqual(_poll_interval(JobStatus.QUEUED, 0, 0.01, 30), MIN_POLLING_INTERVAL)
+
+    def test_running_is_constant(self):
+        """ running jobs are polled every `wait` seconds """
+        for attempt in range(5):
+            self.assertEqual(_poll_interval(JobStatus.RUNNING, attempt, 2, 30), 2)
+
+    def test_queued_backs_off_to_cap(self):
+        """ queued jobs are polled less and less often, up to `max_wait` seconds """
+        intervals = [_poll_interval(JobStatus.QUEUED, attempt, 5.0, 30) for attempt in range(5)]
+        self.assertListEqual(intervals, [5.0, 10.0, 20.0, 30, 30])
+
+    def test_cap_below_wait(self):
+        """ `wait` wins over a smaller `max_wait` """
+        self.assertEqual(_poll_interval(JobStatus.QUEUED, 3, 5.0, 1), 5.0)
+
+    def test_large_attempt(self):
+        """ a very long queue does not overflow """
+        self.assertEqual(_poll_interval(JobStatus.QUEUED, 5000, 5.0, 30), 30)
+        self.assertEqual(_poll_interval(JobStatus.QUEUED, 10 ** 6, 0.1, 1), 1)
+
+
+class TestSplitQobj(QiskitAquaTestCase):
+    """ Test the split of a qobj into qobjs within the payload of the backend """
+
+    def setUp(self):
+        super().setUp()
+        self.qobj = _qobj(['a', 'b', 'c', 'd', 'e'])
+
+    def test_no_split(self):
+        """ a qobj within the payload is not split """
+        self.assertListEqual(_split_qobj_to_qobjs(self.qobj, 5), [self.qobj])
+        self.assertListEqual(_split_qobj_to_qobjs(self.qobj, 10), [self.qobj])
+
+    def test_split(self):
+        """ the experiments are split in order, the config and header are shared """
+        qobjs = _split_qobj_to_qobjs(self.qobj, 2)
+        self.assertListEqual([_exp_names(qobj) for qobj in qobjs],
+                             [['a', 'b'], ['c', 'd'], ['e']])
+        self.assertEqual(len({qobj.qobj_id for qobj in qobjs}), 3)
+        self.assertNotIn(self.qobj.qobj_id, [qobj.qobj_id for qobj in qobjs])
+        for qobj in qobjs:
+            self.assertIs(qobj.config, qobjs[0].config)
+            self.assertIs(qobj.header, self.qobj.header)
+        # the original qobj is untouched
+        self.assertListEqual(_exp_names(self.qobj), ['a', 'b', 'c', 'd', 'e'])
+
+    def test_split_non_qasm_qobj(self):
+        """ only a QasmQobj can be split """
+        qobj = SimpleNamespace(experiments=[None] * 3)
+        self.assertRaises(AquaError, _split_qobj_to_qobjs, qobj, 2)
+
+
+class TestResultCombiner(QiskitAquaTestCase):
+    """ Test the combination of the results of split qobjs """
+
+    def setUp(self):
+        super().setUp()
+        self.qobjs = [SimpleNamespace(experiments=[None] * size) for size in [2, 1, 2]]
+
+    def test_out_of_order(self):
+        """ results are combined in the order of the qobjs whatever the completion order """
+        combiner = _ResultCombiner(self.qobjs)
+        first = _result(['a', 'b'])
+        combiner.add(2, _result(['d', 'e']))
+        combiner.add(0, first)
+        combiner.add(1, _result(['c']))
+        result = combiner.result()
+        self.assertListEqual(_names(result), ['a', 'b', 'c', 'd', 'e'])
+        # the first result is not modified
+        self.assertListEqual(_names(first), ['a', 'b'])
+
+    def test_size_mismatch(self):
+        """ a result without one result per experiment is rejected """
+        combiner = _ResultCombiner(self.qobjs)
+        with self.assertRaises(AquaError):
+            combiner.add(1, _result(['c', 'c2']))
+
+    def test_missing_result(self):
+        """ the combined result is not available until all the results are added """
+        combiner = _ResultCombiner(self.qobjs)
+        combiner.add(1, _result(['c']))
+        combiner.add(2, _result(['d', 'e']))
+        with self.assertRaises(AquaError):
+            combiner.result()
+
+
+class TestWatchJob(QiskitAquaTestCase):
+    """ Test the recovery of failed jobs """
+
+    def setUp(self):
+        super().setUp()
+        self.qobj = _qobj(['a', 'b', 'c'])
+
+    def _watch(self, job, backend):
+        return _watch_job(job, job.job_id(), 0, self.qobj, backend, {'wait': 0}, {},
+                          {}, {}, False, None)
+
+    def test_partial_failure(self):
+        """ only the failed experiments are submitted again, and merged back in order """
+        job = _MockJob('job0', self.qobj, JobStatus.ERROR, failed=('b',))
+        backend = _MockBackend([(JobStatus.DONE, (), True)])
+        result = self._watch(job, backend)
+        self.assertListEqual(backend.submitted, [['b']])
+        self.assertListEqual(_names(result), ['a', 'b', 'c'])
+        self.assertListEqual([exp_result.job_id for exp_result in result.results],
+                             ['job0', 'job1', 'job0'])
+
+    def test_all_failed(self):
+        """ the whole qobj is submitted again when every experiment failed """
+        job = _MockJob('job0', self.qobj, JobStatus.ERROR, failed=('a', 'b', 'c'))
+        backend = _MockBackend([(JobStatus.DONE, (), True)])
+        result = self._watch(job, backend)
+        self.assertListEqual(backend.submitted, [['a', 'b', 'c']])
+        self.assertListEqual(_names(result), ['a', 'b', 'c'])
+        self.assertListEqual([exp_result.job_id for exp_result in result.results],
+                             ['job1', 'job1', 'job1'])
+
+    def test_partial_unsupported(self):
+        """ the whole qobj is submitted again when partial results are not supported """
+        job = _MockJob('job0', self.qobj, JobStatus.ERROR, failed=('b',), partial=False)
+        backend = _MockBackend([(JobStatus.DONE, (), True)])
+        result = self._watch(job, backend)
+        self.assertListEqual(backend.submitted, [['a', 'b', 'c']])
+        self.assertListEqual(_names(result), ['a', 'b', 'c'])
+
+    def test_retry_fails_again(self):
+        """ a submitted again job that fails again is itself trimmed to its failures """
+        job = _MockJob('job0', self.qobj, JobStatus.ERROR, failed=('b', 'c'))
+        backend = _MockBackend([(JobStatus.ERROR, ('c',), True),
+                                (JobStatus.DONE, (), True)])
+        result = self._watch(job, backend)
+        self.assertListEqual(backend.submitted, [['b', 'c'], ['c']])
+        self.assertListEqual(_names(result), ['a', 'b', 'c'])
+        self.assertListEqual([exp_result.job_id for exp_result in result.results],
+                             ['job0', 'job1', 'job2'])
+
+
+class _SequenceJob(_MockJob):
+    """ a job going through the given (status, queue position) pairs, one per status query """
+
+    def __init__(self, job_id, qobj, statuses):
+        super().__init__(job_id, qobj, JobStatus.DONE)
+        self._statuses = list(statuses)
+        self._queue_position = None
+
+    def status(self):
+        """ next job status """
+        status, self._queue_position = self._statuses.pop(0)
+        return status
+
+    def queue_position(self):
+        """ queue position at the last status query """
+        return self._queue_position
+
+
+class TestJobCallback(QiskitAquaTestCase):
+    """ Test the notification of the job status """
+
+    def test_callback_on_change(self):
+        """ the callback is only called when the status or queue position changes """
+        qobj = _qobj(['a'])
+        job = _SequenceJob('job0', qobj, [(JobStatus.QUEUED, 3), (JobStatus.QUEUED, 3),
+                                          (JobStatus.QUEUED, 2), (JobStatus.RUNNING, None),
+                                          (JobStatus.RUNNING, None), (JobStatus.DONE, None)])
+        calls = []
+
+        def callback(job_id, job_status, queue_position, job):
+            # pylint: disable=unused-argument
+            calls.append((job_id, job_status, queue_position))
+
+        result = _watch_job(job, 'job0', 0, qobj, _MockBackend([]),
+                            {'wait': 0, 'max_wait': 0}, {}, {}, {}, False, callback)
+        self.assertListEqual(_names(result), ['a'])
+        self.assertListEqual(calls, [('job0', JobStatus.QUEUED, 3),
+                                     ('job0', JobStatus.QUEUED, 2),
+                                     ('job0', JobStatus.RUNNING, 0),
+                                     ('job0', JobStatus.DONE, 0)])
+
+
+class _PolledJob(_MockJob):
+    """ a job going through the given statuses, one per status query, staying at the last one """
+
+    def __init__(self, job_id, qobj, statuses, completed):
+        super().__init__(job_id, qobj, JobStatus.DONE)
+        self._statuses = list(statuses)
+        self._completed = completed
+        self.polls = 0
+        self.cancelled = False
+
+    def status(self):
+        """ next job status, an exception in the statuses is raised """
+        self.polls += 1
+        status = self._statuses.pop(0) if len(self._statuses) > 1 else self._statuses[0]
+        if isinstance(status, Exception):
+            raise status
+        if status == JobStatus.DONE and self._names[0] not in self._completed:
+            self._completed.append(self._names[0])
+        return status
+
+    def queue_position(self):
+        """ queue position """
+        return 1
+
+    def cancel(self):
+        """ cancel the job """
+        self.cancelled = True
+
+
+class _RemoteBackend(BaseBackend):
+    """ a remote device running at most two experiments per job
+
+    The statuses of each job are given by the name of the first experiment of its qobj.
+    """
+
+    def __init__(self, statuses, fail_on=()):
+        super().__init__(SimpleNamespace(simulator=False, local=False, max_experiments=2))
+        self._statuses = statuses
+        self._fail_on = fail_on
+        self._lock = threading.Lock()
+        self.jobs = []
+        self.completed = []
+
+    def status(self):
+        """ backend status """
+        return 'active'
+
+    def run(self, qobj, **kwargs):
+        """ submit a job, or fail for the experiments in `fail_on` """
+        # pylint: disable=unused-argument
+        name = _exp_names(qobj)[0]
+        if name in self._fail_on:
+            raise RuntimeError('can not submit {}'.format(name))
+        with self._lock:
+            job = _PolledJob('job{}'.format(len(self.jobs)), qobj, self._statuses[name],
+                             self.completed)
+            self.jobs.append(job)
+        return job
+
+
+class TestRunQobj(QiskitAquaTestCase):
+    """ Test running a qobj split into several jobs """
+
+    def setUp(self):
+        super().setUp()
+        # split into the jobs of [a, b], [c, d] and [e]
+        self.qobj = _qobj(['a', 'b', 'c', 'd', 'e'])
+        self.qjob_config = {'wait': 0, 'max_wait': 0}
+
+    def test_submission_failure(self):
+        """ the jobs submitted before a submission fails are cancelled """
+        backend = _RemoteBackend({'a': [JobStatus.RUNNING], 'e': [JobStatus.RUNNING]},
+                                 fail_on=('c',))
+        with self.assertRaises(RuntimeError):
+            run_qobj(self.qobj, backend, self.qjob_config)
+        for job in backend.jobs:
+            self.assertTrue(job.cancelled)
+
+    def test_out_of_order_completion(self):
+        """ the combined result keeps the order of the circuits """
+        backend = _RemoteBackend({'a': [JobStatus.RUNNING] * 3 + [JobStatus.DONE],
+                                  'c': [JobStatus.DONE],
+                                  'e': [JobStatus.RUNNING, JobStatus.DONE]})
+        result = run_qobj(self.qobj, backend, self.qjob_config)
+        self.assertListEqual(backend.completed, ['c', 'e', 'a'])
+        self.assertListEqual(_names(result), ['a', 'b', 'c', 'd', 'e'])
+
+    def test_watcher_failure(self):
+        """ a failing job raises, and the other jobs are no longer watched nor re-submitted """
+        backend = _RemoteBackend({'a': [JobStatus.RUNNING],
+                                  'c': [RuntimeError('status is lost')],
+                                  'e': [JobStatus.RUNNING, JobStatus.CANCELLED]})
+        with self.assertRaises(AquaError):
+            run_qobj(self.qobj, backend, self.qjob_config)
+        time.sleep(0.3)
+        polls = [job.polls for job in backend.jobs]
+        time.sleep(0.3)
+        self.assertListEqual([job.polls for job in backend.jobs], polls)
+        # no job is submitted again
+        self.assertEqual(len(backend.jobs), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()